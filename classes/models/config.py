@@ -0,0 +1,159 @@
+import copy
+from dataclasses import dataclass, field
+from functools import lru_cache
+import os
+from types import MappingProxyType
+from jsonschema import Draft7Validator
+import numpy as np
+
+# orjson parses faster when available, the standard library parser also accepts bytes
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Schema of the config file, the validator is built once at import time.
+# Unknown top-level keys are rejected to catch misspelled optional settings such as initial_angle
+_CONFIG_SCHEMA = {
+    'type': 'object',
+    'additionalProperties': False,
+    'required': ['simulation_duration_seconds', 'room_dim_meters', 'margin_meters', 'speed_meters_second', 'initial_position', 'simulators'],
+    'properties': {
+        'simulation_duration_seconds': {'type': 'integer', 'minimum': 1},
+        'room_dim_meters': {
+            'type': 'object',
+            'required': ['x', 'y'],
+            'properties': {
+                'x': {'type': 'number', 'exclusiveMinimum': 0},
+                'y': {'type': 'number', 'exclusiveMinimum': 0}
+            }
+        },
+        'margin_meters': {'type': 'number', 'minimum': 0},
+        'speed_meters_second': {
+            'type': 'object',
+            'required': ['min'],
+            'properties': {
+                'min': {'type': 'number', 'exclusiveMinimum': 0},
+                'max': {'type': 'number', 'exclusiveMinimum': 0}
+            }
+        },
+        'initial_position': {
+            'type': 'object',
+            'required': ['x', 'y'],
+            'properties': {
+                'x': {'type': 'number', 'minimum': 0},
+                'y': {'type': 'number', 'minimum': 0}
+            }
+        },
+        'initial_angle': {'type': 'number'},
+        'simulators': {
+            'type': 'object',
+            'required': ['trajectory', 'rssi'],
+            'properties': {
+                'trajectory': {'type': 'string'},
+                'rssi': {'type': 'string'}
+            }
+        }
+    }
+}
+_CONFIG_VALIDATOR = Draft7Validator(_CONFIG_SCHEMA)
+
+
+# eq=False keeps the identity based hash, the nested mappings are not hashable
+@dataclass(slots=True, frozen=True, eq=False)
+class Config:
+    '''
+    Class representing the simulation settings loaded from the config file.
+    The nested settings are read-only copies of the given dicts.
+    '''
+
+    simulation_duration_seconds: int
+    room_dim_meters: MappingProxyType
+    margin_meters: float
+    speed_meters_second: MappingProxyType
+    initial_position: MappingProxyType
+    initial_angle: float
+    simulators: MappingProxyType
+    min_x: float = field(init=False)
+    max_x: float = field(init=False)
+    min_y: float = field(init=False)
+    max_y: float = field(init=False)
+
+    def __post_init__(self):
+        # Read-only copies, so the config cannot be modified through the dicts it was built from
+        for name in ('room_dim_meters', 'speed_meters_second', 'initial_position', 'simulators'):
+            object.__setattr__(self, name, MappingProxyType(dict(getattr(self, name))))
+
+        # Limits of the trajectory, calculated once as the config never changes
+        margin = self.margin_meters
+        min_x, max_x = margin, self.room_dim_meters['x'] - margin
+        min_y, max_y = margin, self.room_dim_meters['y'] - margin
+        object.__setattr__(self, 'min_x', min_x)
+        object.__setattr__(self, 'max_x', max_x)
+        object.__setattr__(self, 'min_y', min_y)
+        object.__setattr__(self, 'max_y', max_y)
+
+        # Verify coherence
+        initial_x, initial_y = self.initial_position['x'], self.initial_position['y']
+        if initial_x < min_x or initial_x > max_x:
+            raise ValueError("Initial x position is out of bounds.")
+        if initial_y < min_y or initial_y > max_y:
+            raise ValueError("Initial y position is out of bounds.")
+
+    @classmethod
+    def from_file(cls, config_path: str) -> 'Config':
+        """
+        Loads and validates the config file.
+
+        Args:
+            config_path (str): The path of the config file.
+
+        Returns:
+            Config: The settings defined in the config file.
+
+        Raises:
+            FileNotFoundError: If the config file does not exist.
+            ValueError: If the config file is not valid.
+        """
+        # First check if the config file exists
+        if not os.path.exists(config_path):
+            raise FileNotFoundError(f"Config file {config_path} not found")
+
+        # Load the config file, reusing the previous result if the file has not changed.
+        # The cached result is shared between calls, so every Config gets its own copy
+        stat = os.stat(config_path)
+        config = copy.deepcopy(dict(cls._load_config_file(os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)))
+
+        # Random initial angle only when it is not defined in the file
+        initial_angle = config.get('initial_angle')
+        initial_angle = float(initial_angle) if initial_angle is not None else float(np.random.default_rng().uniform(0, 2 * np.pi))
+
+        return cls(
+            simulation_duration_seconds=config['simulation_duration_seconds'],
+            room_dim_meters=config['room_dim_meters'],
+            margin_meters=config['margin_meters'],
+            speed_meters_second=config['speed_meters_second'],
+            initial_position=config['initial_position'],
+            initial_angle=initial_angle,
+            simulators=config['simulators'])
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _load_config_file(config_path: str, mtime_ns: int, size: int) -> MappingProxyType:
+        # The modification time and size are part of the cache key, so a modified file is loaded again
+        with open(config_path, 'rb') as file:
+            config = _loads(file.read())
+
+        # Check if the config file was loaded correctly
+        if not isinstance(config, dict):
+            raise ValueError("Invalid config file format.")
+
+        Config._validate_config(config)
+        return MappingProxyType(config)
+
+    @staticmethod
+    def _validate_config(config: dict):
+        # Validate the config against the schema, reporting all the errors at once
+        errors = [f"{error.json_path}: {error.message}" for error in _CONFIG_VALIDATOR.iter_errors(config)]
+        if errors:
+            raise ValueError("Invalid config file: " + "; ".join(errors))
@@ -1,7 +1,6 @@
 from classes.simulators.rssi.interface import RssiInterface
 from classes.models.station import Station
-from math import sqrt
-import numpy as np
+from math import sqrt, log10
 import random
 
 class LogDistancePathLossModel(RssiInterface):
@@ -18,7 +17,7 @@ class LogDistancePathLossModel(RssiInterface):
         
         # Calculate the rssi
         if distance != 0:
-            rssi = Tx - (10 * n * np.log10(distance))
+            rssi = Tx - (10 * n * log10(distance))
         else:
             rssi = Tx
 
@@ -1,13 +1,16 @@
 from classes.simulators.trajectory.interface import TrajectoryInterface
+from math import cos, sin, pi
 import numpy as np
-import random
+
+_OUTBOUNDS_RATIO = pi / 8
 
 class DanisCemgil2017(TrajectoryInterface):
+    __slots__ = ('s', 'outbounds_ratio')
 
     def __init__(self):
         # Inicialización de variables
         self.s = 0.07                          # desviación estandar de la distribución normal usada para aleatorizar el ángulo. 0 = no hay varianza en el ángulo
-        self.outbounds_ration = np.pi / 8   # Giro forzado para mantener al robot dentro del área. To prevent our virtual robot from leaving the area, sampled rotation values are deliberately manipulated by an additional value of π8 according to the current orientation
+        self.outbounds_ratio = _OUTBOUNDS_RATIO # Giro forzado para mantener al robot dentro del área. To prevent our virtual robot from leaving the area, sampled rotation values are deliberately manipulated by an additional value of π8 according to the current orientation
 
     def calculate_position(self, current_time: int, milliseconds_per_iteration: int, last_angle: float, last_x: float, last_y: float, min_x: float, max_x: float, min_y: float, max_y: float, speed: float) -> tuple:
         x = last_x
@@ -16,8 +19,8 @@ class DanisCemgil2017(TrajectoryInterface):
         #Calculamos el angulo de avance               
         # Manipulación del valor de rotación para mantener al robot dentro del área
         delta_angle = 0
-        if x < min_x or x > max_x or y < min_y or y > max_y:
-            delta_angle = self.outbounds_ration
+        if not (min_x <= x <= max_x and min_y <= y <= max_y):
+            delta_angle = self.outbounds_ratio
         else:
             # ̃δθ_t ∼ N(0, s)
             delta_angle = np.random.normal(0, self.s)
@@ -29,9 +32,9 @@ class DanisCemgil2017(TrajectoryInterface):
 
         #Incrementamos posiciones
         # x_t = x_(t−1) +  ̃δl_t cos(θ_(t−1) +  ̃δθ_t)
-        x += delta_l * np.cos(angle)
+        x += delta_l * cos(angle)
         # y_t = y_(t−1) +  ̃δl_t sin(θ_(t−1) +  ̃δθ_t)
-        y += delta_l * np.sin(angle)
+        y += delta_l * sin(angle)
 
         # Devolvemos
         return (x, y, angle)
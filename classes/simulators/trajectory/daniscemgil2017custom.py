@@ -1,54 +1,178 @@
 from classes.simulators.trajectory.interface import TrajectoryInterface
+from math import cos, sin, pi
 import numpy as np
-import random
+
+_OUTBOUNDS_RATIO = pi / 8 # Giro forzado al salir del área
+_BLOCK_SIZE = 1024 # Número máximo de pasos integrados de una vez por generate_trajectory
+_INITIAL_BLOCK_SIZE = 128 # Tamaño del bloque tras salir del área, se duplica mientras los bloques terminan dentro
+_MIN_SAFE_STEPS = 4 # Por debajo de este número de pasos seguros es más rápido avanzar paso a paso
+_NOISE_BUFFER_SIZE = 4096 # Número de muestras N(0, 1) generadas de una vez para calculate_position
+
+# numba es una dependencia opcional: compila _calc_pos si está instalado
+try:
+    from numba import njit
+except ImportError:
+    # Sin numba el paso se ejecuta como Python normal
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+@njit(cache=True, fastmath=True)
+def _calc_pos(last_angle, last_x, last_y, min_x, max_x, min_y, max_y, delta_l, outbounds_ratio, noise_sample):
+    x = last_x
+    y = last_y
+
+    #Calculamos el angulo de avance
+    # Manipulación del valor de rotación para mantener al robot dentro del área
+    if not (min_x <= x <= max_x and min_y <= y <= max_y):
+        delta_angle = outbounds_ratio
+    else:
+        delta_angle = noise_sample
+
+    angle = last_angle + delta_angle
+
+    #Incrementamos posiciones
+    # x_t = x_(t−1) +  ̃δl_t cos(θ_(t−1) +  ̃δθ_t)
+    x += delta_l * cos(angle)
+    # y_t = y_(t−1) +  ̃δl_t sin(θ_(t−1) +  ̃δθ_t)
+    y += delta_l * sin(angle)
+
+    # Devolvemos
+    return (x, y, angle)
 
 class DanisCemgil2017Custom(TrajectoryInterface):
     '''
     Clase que implementa el modelo de trayectoria de Danis Cemgil 2017
     This variation retains the path angle for a random time between 1 and 5 seconds before changing it. This is done to simulate a less chaotic movement pattern.
     '''
-    def __init__(self):
+    __slots__ = ('s', 'outbounds_ratio', '_action', '_next_action_time', '_rng', '_noise_buf', '_noise_idx')
+
+    def __init__(self, seed: int | None = None):
         # Inicialización de variables
+        self._rng = np.random.default_rng(seed) # Generador de números aleatorios. seed permite reproducir la trayectoria
+        self._noise_buf = self._rng.standard_normal(_NOISE_BUFFER_SIZE)
+        self._noise_idx = 0
         self.s = 1                          # desviación estandar de la distribución normal usada para aleatorizar el ángulo. 0 = no hay varianza en el ángulo
-        self.outbounds_ration = np.pi / 8   # Giro forzado para mantener al robot dentro del área. To prevent our virtual robot from leaving the area, sampled rotation values are deliberately manipulated by an additional value of π8 according to the current orientation
+        self.outbounds_ratio = _OUTBOUNDS_RATIO # Giro forzado para mantener al robot dentro del área. To prevent our virtual robot from leaving the area, sampled rotation values are deliberately manipulated by an additional value of π8 according to the current orientation
         self._action = 1 # Acción actual. 0 = mantener el ángulo, 1 = cambiar el ángulo
         self._next_action_time = self.get_random_next_action_time() # Tiempo de la siguiente acción
 
     def get_random_next_action_time(self) -> int:
         if self._action == 0: #Andando recto simulamos un tiempo mayor
-            return random.randint(2000, 5000)
+            return int(self._rng.integers(2000, 5000, endpoint=True))
         else: #Cambiando de dirección simulamos un tiempo menor
-            return random.randint(100, 1000)
+            return int(self._rng.integers(100, 1000, endpoint=True))
 
-    def calculate_position(self, current_time: int, milliseconds_per_iteration: int, last_angle: float, last_x: float, last_y: float, min_x: float, max_x: float, min_y: float, max_y: float, speed: float) -> tuple:
-        x = last_x
-        y = last_y
+    def _next_noise(self) -> float:
+        # Siguiente muestra de N(0, s), regenerando el buffer cuando se agota
+        if self._noise_idx == _NOISE_BUFFER_SIZE:
+            self._rng.standard_normal(_NOISE_BUFFER_SIZE, out=self._noise_buf)
+            self._noise_idx = 0
+        noise = float(self._noise_buf[self._noise_idx]) * self.s
+        self._noise_idx += 1
+        return noise
 
+    def _next_angle_noise(self, current_time: int) -> float:
         # Determinamos la acción
         if current_time > self._next_action_time:
             self._action = 1 - self._action
             self._next_action_time = current_time + self.get_random_next_action_time()
 
-        #Calculamos el angulo de avance               
-        # Manipulación del valor de rotación para mantener al robot dentro del área
-        delta_angle = 0
-        if x < min_x or x > max_x or y < min_y or y > max_y:
-            delta_angle = self.outbounds_ration
-        elif self._action == 1:
-            # ̃δθ_t ∼ N(0, s)
-            delta_angle = np.random.normal(0, self.s)
+        # ̃δθ_t ∼ N(0, s) solo si estamos cambiando de dirección
+        return self._next_noise() if self._action == 1 else 0.0
+
+    def calculate_position(self, current_time: int, milliseconds_per_iteration: int, last_angle: float, last_x: float, last_y: float, min_x: float, max_x: float, min_y: float, max_y: float, speed: float) -> tuple:
+        #Calculamos la distancia recorrida
+        delta_l = speed * milliseconds_per_iteration / 1000 # velocidad en m/s * tiempo en segundos = distancia recorrida en metros
+        return _calc_pos(last_angle, last_x, last_y, min_x, max_x, min_y, max_y, delta_l, self.outbounds_ratio, self._next_angle_noise(current_time))
+
+    def bind(self, min_x: float, max_x: float, min_y: float, max_y: float, speed: float, milliseconds_per_iteration: int):
+        #Calculamos la distancia recorrida una sola vez
+        delta_l = speed * milliseconds_per_iteration / 1000 # velocidad en m/s * tiempo en segundos = distancia recorrida en metros
+        outbounds_ratio = self.outbounds_ratio
+        next_angle_noise = self._next_angle_noise
+
+        def step(current_time: int, last_angle: float, last_x: float, last_y: float) -> tuple:
+            return _calc_pos(last_angle, last_x, last_y, min_x, max_x, min_y, max_y, delta_l, outbounds_ratio, next_angle_noise(current_time))
+
+        return step
 
-        angle = last_angle + delta_angle
+    def generate_trajectory(self, n_steps: int, milliseconds_per_iteration: int, initial_angle: float, initial_x: float, initial_y: float, min_x: float, max_x: float, min_y: float, max_y: float, speed: float, start_time: int = 0) -> tuple:
+        '''
+        Batched version of calculate_position. The angle perturbations are sampled in a single call and the
+        positions are integrated with cumulative sums, falling back to scalar steps only while out of bounds.
+        '''
+        times = start_time + milliseconds_per_iteration * np.arange(1, n_steps + 1)
+
+        # Perturbaciones del ángulo, anuladas en los pasos en los que se mantiene la dirección
+        delta_angles = self._rng.normal(0, self.s, n_steps)
+        delta_angles[self._generate_actions(times) == 0] = 0
 
         #Calculamos la distancia recorrida
         delta_l = speed * milliseconds_per_iteration / 1000 # velocidad en m/s * tiempo en segundos = distancia recorrida en metros
 
-        #Incrementamos posiciones
-        # x_t = x_(t−1) +  ̃δl_t cos(θ_(t−1) +  ̃δθ_t)
-        x += delta_l * np.cos(angle)
-        # y_t = y_(t−1) +  ̃δl_t sin(θ_(t−1) +  ̃δθ_t)
-        y += delta_l * np.sin(angle)
+        xs, ys, angles = self._allocate_trajectory(n_steps)
+        x, y, angle = initial_x, initial_y, initial_angle
+        noise = delta_angles.tolist() # Acceso rápido a las perturbaciones en los pasos individuales
+        outbounds_ratio = self.outbounds_ratio
+        reach = _MIN_SAFE_STEPS * delta_l # Distancia máxima recorrida en _MIN_SAFE_STEPS pasos
+        block_size = _INITIAL_BLOCK_SIZE
+        i = 0
+        while i < n_steps:
+            if not (min_x + reach < x < max_x - reach and min_y + reach < y < max_y - reach):
+                # Fuera del área o cerca de sus límites: paso a paso, con giro forzado si estamos fuera
+                x, y, angle = _calc_pos(angle, x, y, min_x, max_x, min_y, max_y, delta_l, outbounds_ratio, noise[i])
+                xs[i] = x
+                ys[i] = y
+                angles[i] = angle
+                i += 1
+                continue
+
+            # Lejos de los límites: integramos un bloque de una vez. Al menos los pasos que seguro quedan dentro
+            # del área, y más si los bloques anteriores terminaron dentro del área
+            safe_steps = int(min(x - min_x, max_x - x, y - min_y, max_y - y) / delta_l) if delta_l > 0 else _BLOCK_SIZE
+            end = min(i + min(max(safe_steps, block_size), _BLOCK_SIZE), n_steps)
+            block_angles = angles[i:end]
+            np.cumsum(delta_angles[i:end], out=block_angles)
+            block_angles += angle
+            block_x = xs[i:end]
+            np.cos(block_angles, out=block_x)
+            block_x *= delta_l
+            np.cumsum(block_x, out=block_x)
+            block_x += x
+            block_y = ys[i:end]
+            np.sin(block_angles, out=block_y)
+            block_y *= delta_l
+            np.cumsum(block_y, out=block_y)
+            block_y += y
+
+            # El bloque solo es válido hasta la primera posición fuera del área, ya que el paso siguiente debe girar
+            outbounds = np.flatnonzero((block_x < min_x) | (block_x > max_x) | (block_y < min_y) | (block_y > max_y))
+            if outbounds.size:
+                end = i + outbounds[0] + 1
+                block_size = _INITIAL_BLOCK_SIZE
+            else:
+                block_size *= 2
+            x, y, angle = xs[end - 1], ys[end - 1], angles[end - 1]
+            i = end
 
         # Devolvemos
-        return (x, y, angle)
+        return (xs, ys, angles)
+
+    def _generate_actions(self, times: np.ndarray) -> np.ndarray:
+        '''
+        Returns the action (0 = keep the angle, 1 = change the angle) taken at each of the given times,
+        advancing the action schedule exactly as successive calls to calculate_position would.
+        '''
+        actions = np.empty(len(times), dtype=np.int8)
+        i = 0
+        while i < len(times):
+            # Primer paso en el que current_time > self._next_action_time
+            j = max(i, int(np.searchsorted(times, self._next_action_time, side='right')))
+            actions[i:j] = self._action
+            if j >= len(times):
+                break
+            self._action = 1 - self._action
+            self._next_action_time = int(times[j]) + self.get_random_next_action_time()
+            i = j
+        return actions
 
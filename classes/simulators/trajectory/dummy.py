@@ -1,7 +1,8 @@
 from classes.simulators.trajectory.interface import TrajectoryInterface
-import random
+from random import uniform
 
 class DummyPositionModule(TrajectoryInterface):
+    __slots__ = ()
 
     def calculate_position(self, current_time: int, milliseconds_per_iteration: int, last_angle: float, last_x: float, last_y: float, min_x: float, max_x: float, min_y: float, max_y: float, speed: float) -> tuple:
-        return (random.uniform(min_x, max_x), random.uniform(min_y, max_y))
\ No newline at end of file
+        return (uniform(min_x, max_x), uniform(min_y, max_y), last_angle)
\ No newline at end of file
@@ -1,17 +1,29 @@
 from classes.simulators.trajectory.interface import TrajectoryInterface
+import importlib
+import sys
+
+# Available trajectory simulators. Entries are 'module:class' paths, replaced by the class itself once imported
+_REGISTRY = {
+    'dummy': 'classes.simulators.trajectory.dummy:DummyPositionModule',
+    'daniscemgil2017': 'classes.simulators.trajectory.daniscemgil2017:DanisCemgil2017',
+    'daniscemgil2017custom': 'classes.simulators.trajectory.daniscemgil2017custom:DanisCemgil2017Custom',
+}
+_REGISTRY = {sys.intern(name): entry for name, entry in _REGISTRY.items()}
 
 class TrajectoryFactory:
     """
     A factory class for creating trajectory simulators.
     """
 
+    # constructor_params defaults to None instead of {}, a mutable default would be shared between calls
     @staticmethod
-    def create_trajectory_simulator(simulator_name: str) -> TrajectoryInterface:
+    def create_trajectory_simulator(simulator_name: str, constructor_params: dict | None = None) -> TrajectoryInterface:
         """
         Creates a trajectory simulator based on the given simulator name.
 
         Args:
             simulator_name (str): The name of the simulator.
+            constructor_params (dict, optional): The keyword arguments for the simulator constructor. Defaults to None.
 
         Returns:
             TrajectoryInterface: An instance of the trajectory simulator.
@@ -19,14 +31,13 @@ class TrajectoryFactory:
         Raises:
             ValueError: If the simulator name is not available.
         """
-        if simulator_name == 'dummy':
-            from classes.simulators.trajectory.dummy import DummyPositionModule
-            return DummyPositionModule()
-        elif simulator_name == 'daniscemgil2017':
-            from classes.simulators.trajectory.daniscemgil2017 import DanisCemgil2017
-            return DanisCemgil2017()
-        elif simulator_name == 'daniscemgil2017custom':
-            from classes.simulators.trajectory.daniscemgil2017custom import DanisCemgil2017Custom
-            return DanisCemgil2017Custom()
-        else:
+        simulator_class = _REGISTRY.get(simulator_name)
+        if simulator_class is None:
             raise ValueError(f"Trajectory simulator {simulator_name} not available.")
+
+        if isinstance(simulator_class, str):
+            module_path, class_name = simulator_class.split(':')
+            simulator_class = getattr(importlib.import_module(module_path), class_name)
+            _REGISTRY[simulator_name] = simulator_class
+
+        return simulator_class() if not constructor_params else simulator_class(**constructor_params)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+import numpy as np
 
-from abc import ABC, abstractmethod
+_CACHE_LINE_BYTES = 64
 
 class TrajectoryInterface(ABC):
     """
@@ -23,8 +24,13 @@ class TrajectoryInterface(ABC):
 
     Methods:
         calculate_position: Calculates the position of the object based on the given parameters.
+        bind: Returns a step function with the parameters that are constant during the simulation fixed.
+        generate_trajectory: Calculates the positions of the object for a number of consecutive iterations.
     """
 
+    # Empty so the simulators can declare their own slots
+    __slots__ = ()
+
     @abstractmethod
     def calculate_position(self, current_time: int, milliseconds_per_iteration: int, last_angle: float, last_x: float, last_y: float, min_x: float, max_x: float, min_y: float, max_y: float, speed: float) -> tuple:
         """
@@ -43,6 +49,84 @@ class TrajectoryInterface(ABC):
             speed (float): The speed of the object.
 
         Returns:
-            tuple: A tuple containing the calculated x and y coordinates of the object.
+            tuple: A tuple containing the calculated x and y coordinates and angle of the object.
+        """
+        pass
+
+    def bind(self, min_x: float, max_x: float, min_y: float, max_y: float, speed: float, milliseconds_per_iteration: int):
+        """
+        Returns a step function with the parameters that stay constant during the simulation fixed.
+
+        The default implementation wraps calculate_position. Simulators can override it to
+        precalculate the values derived from the fixed parameters.
+
+        Args:
+            min_x (float): The minimum x-coordinate value.
+            max_x (float): The maximum x-coordinate value.
+            min_y (float): The minimum y-coordinate value.
+            max_y (float): The maximum y-coordinate value.
+            speed (float): The speed of the object.
+            milliseconds_per_iteration (int): The number of milliseconds per iteration.
+
+        Returns:
+            callable: A function step(current_time, last_angle, last_x, last_y) returning the same tuple as calculate_position.
+        """
+        calculate_position = self.calculate_position
+
+        def step(current_time: int, last_angle: float, last_x: float, last_y: float) -> tuple:
+            return calculate_position(current_time, milliseconds_per_iteration, last_angle, last_x, last_y, min_x, max_x, min_y, max_y, speed)
+
+        return step
+
+    def generate_trajectory(self, n_steps: int, milliseconds_per_iteration: int, initial_angle: float, initial_x: float, initial_y: float, min_x: float, max_x: float, min_y: float, max_y: float, speed: float, start_time: int = 0) -> tuple:
+        """
+        Calculates the positions of the object for a number of consecutive iterations.
+
+        The default implementation calls the bound step function once per iteration. Simulators can
+        override it with a batched implementation.
+
+        Args:
+            n_steps (int): The number of iterations to calculate.
+            milliseconds_per_iteration (int): The number of milliseconds per iteration.
+            initial_angle (float): The angle of the object before the first iteration.
+            initial_x (float): The x-coordinate of the object before the first iteration.
+            initial_y (float): The y-coordinate of the object before the first iteration.
+            min_x (float): The minimum x-coordinate value.
+            max_x (float): The maximum x-coordinate value.
+            min_y (float): The minimum y-coordinate value.
+            max_y (float): The maximum y-coordinate value.
+            speed (float): The speed of the object.
+            start_time (int, optional): The time in milliseconds before the first iteration. Defaults to 0.
+
+        Returns:
+            tuple: A tuple containing the arrays of x coordinates, y coordinates and angles, one element per iteration.
+                The three arrays are separate and contiguous, and element i of each belongs to the same iteration.
+        """
+        xs, ys, angles = self._allocate_trajectory(n_steps)
+        step = self.bind(min_x, max_x, min_y, max_y, speed, milliseconds_per_iteration)
+        x, y, angle = initial_x, initial_y, initial_angle
+        for i in range(n_steps):
+            x, y, angle = step(start_time + (i + 1) * milliseconds_per_iteration, angle, x, y)
+            xs[i], ys[i], angles[i] = x, y, angle
+        return (xs, ys, angles)
+
+    @staticmethod
+    def _allocate_trajectory(n_steps: int) -> tuple:
+        """
+        Allocates the uninitialized x, y and angle arrays returned by generate_trajectory.
+
+        Each array is a separate float64 array aligned to a cache line, so consumers of a
+        single coordinate read contiguous memory.
+
+        Args:
+            n_steps (int): The number of iterations.
+
+        Returns:
+            tuple: A tuple containing the x, y and angle arrays.
         """
-        pass
\ No newline at end of file
+        arrays = []
+        for _ in range(3):
+            buffer = np.empty(n_steps + _CACHE_LINE_BYTES // 8, dtype=np.float64)
+            offset = (-buffer.ctypes.data % _CACHE_LINE_BYTES) // 8
+            arrays.append(buffer[offset:offset + n_steps])
+        return tuple(arrays)
@@ -0,0 +1 @@
+# Makes pytest add the repository root to sys.path, so the tests can import the classes package
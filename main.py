@@ -2,12 +2,18 @@ import argparse
 import os
 import json
 import random
+from classes.models.config import Config
 from classes.models.station import Station
 from classes.lib.bufferedcsvfilewriter import BufferedCsvFileWriter
 from classes.simulators.trajectory.factory import TrajectoryFactory
 from classes.simulators.rssi.factory import RssiFactory
 import datetime
-import numpy as np
+import math
+
+
+def count_iterations(max_time_milliseconds: float, milliseconds_per_iteration: float) -> int:
+    # Iterations needed to reach the maximum time, the durations may come as floats from the json files
+    return int(math.ceil(max_time_milliseconds / milliseconds_per_iteration))
 
 
 class App:
@@ -19,23 +25,8 @@ class App:
         self.position_rounding = 9
 
     def loadSettings(self, config_path):
-        # First check if the config file exists
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(f"Config file {config_path} not found")
-
-        # Load the config file as json file
-        with open(config_path, 'r') as file:
-            self.config = json.load(file)
-
-        # Check if the config file was loaded correctly
-        if not isinstance(self.config, dict):
-            raise ValueError("Invalid config file format.")
-
-        # Verify coherence
-        if self.config['initial_position']['x'] < self.config['margin_meters'] or self.config['initial_position']['x'] > self.config['room_dim_meters']['x'] - self.config['margin_meters']:
-            raise ValueError("Initial x position is out of bounds.")
-        if self.config['initial_position']['y'] < self.config['margin_meters'] or self.config['initial_position']['y'] > self.config['room_dim_meters']['y'] - self.config['margin_meters']:
-            raise ValueError("Initial y position is out of bounds.")
+        # Load and validate the config file
+        self.config = Config.from_file(config_path)
 
     def loadStations(self, stations_path):
         # First check if the config file exists
@@ -61,7 +52,7 @@ class App:
 
     def start(self):
         # Initialize main variables
-        max_time_milliseconds = self.config['simulation_duration_seconds'] * 1000
+        max_time_milliseconds = self.config.simulation_duration_seconds * 1000
         current_time = 0
         iteration = 0
         milliseconds_per_iteration = min(
@@ -69,21 +60,19 @@ class App:
         if milliseconds_per_iteration < 10:
             raise ValueError("Minimum frequency is 10 millisecond.")
 
-        # Define maximal and minimal x and y coordinates
-        dim_x = self.config['room_dim_meters']['x']
-        dim_y = self.config['room_dim_meters']['y']
-        dim_margins = self.config['margin_meters']
-        min_x = dim_margins
-        max_x = dim_x - dim_margins
-        min_y = dim_margins
-        max_y = dim_y - dim_margins
-        pos_x = round(self.config['initial_position']
+        # Maximal and minimal x and y coordinates are precalculated by the config
+        dim_x = self.config.room_dim_meters['x']
+        dim_y = self.config.room_dim_meters['y']
+        min_x = self.config.min_x
+        max_x = self.config.max_x
+        min_y = self.config.min_y
+        max_y = self.config.max_y
+        pos_x = round(self.config.initial_position
                       ['x'], ndigits=self.position_rounding)
-        pos_y = round(self.config['initial_position']
+        pos_y = round(self.config.initial_position
                       ['y'], ndigits=self.position_rounding)
-        speed = self.config['speed_meters_second']['min']
-        angle = self.config.get(
-            'initial_angle', np.random.uniform(0, 2 * np.pi))
+        speed = self.config.speed_meters_second['min']
+        angle = self.config.initial_angle
 
         # Create output file writers
         # Concatenate date and time to the file names
@@ -107,23 +96,24 @@ class App:
         # Initialize simulators modules
         # TODO: Define the attributes for the constructors
         position_simulator_module = TrajectoryFactory.create_trajectory_simulator(
-            self.config['simulators']['trajectory'])
+            self.config.simulators['trajectory'])
         rssi_simulator_module = RssiFactory.create_rssi_simulator(
-            self.config['simulators']['rssi'])
+            self.config.simulators['rssi'])
+
+        # Calculate the whole trajectory at once
+        n_steps = count_iterations(max_time_milliseconds, milliseconds_per_iteration)
+        trajectory_x, trajectory_y, _ = position_simulator_module.generate_trajectory(n_steps=n_steps, milliseconds_per_iteration=milliseconds_per_iteration,
+                                                                                       initial_angle=angle, initial_x=pos_x, initial_y=pos_y, min_x=min_x, max_x=max_x, min_y=min_y, max_y=max_y, speed=speed)
 
         try:
             # Main loop
-            while True:
-                # Increase counters
-                iteration += 1
-                current_time += milliseconds_per_iteration
-
-                # Calculate the new position of the stations
-                pos_x, pos_y, angle = position_simulator_module.calculate_position(current_time=current_time, milliseconds_per_iteration=milliseconds_per_iteration,
-                                                                                   last_angle=angle, last_x=pos_x, last_y=pos_y, min_x=min_x, max_x=max_x, min_y=min_y, max_y=max_y, speed=speed)
-                pos_x = round(pos_x,
+            for iteration in range(1, n_steps + 1):
+                current_time = iteration * milliseconds_per_iteration
+
+                # Get the new position from the precalculated trajectory
+                pos_x = round(float(trajectory_x[iteration - 1]),
                               ndigits=self.position_rounding)
-                pos_y = round(pos_y,
+                pos_y = round(float(trajectory_y[iteration - 1]),
                               ndigits=self.position_rounding)
 
                 # Write the new position to the output file
@@ -143,10 +133,6 @@ class App:
                     # Write the RSSI value to the output file
                     rssi_writer.write(
                         [current_time, pos_x, pos_y, station.mac, rssi])
-
-                # Check if we achieved the maximum execution time
-                if current_time >= max_time_milliseconds:
-                    break
         finally:
             # Close the output file writers
             rssi_writer.close()
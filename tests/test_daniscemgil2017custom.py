@@ -0,0 +1,108 @@
+import itertools
+import numpy as np
+from classes.simulators.trajectory.daniscemgil2017custom import DanisCemgil2017Custom
+
+N_STEPS = 3000
+MILLISECONDS_PER_ITERATION = 100
+BOUNDS = dict(min_x=1, max_x=20, min_y=1, max_y=16)
+SPEED = 1.5
+
+
+class FixedScheduleSimulator(DanisCemgil2017Custom):
+    '''
+    Simulator with a deterministic action schedule, so two instances take the same actions
+    no matter in which order they draw from their random generators.
+    '''
+    def __init__(self, s):
+        self._durations = itertools.cycle([700, 3000, 250, 4100, 900, 2200])
+        super().__init__(seed=0)
+        self.s = s
+
+    def get_random_next_action_time(self) -> int:
+        return next(self._durations)
+
+
+class RecordingGenerator:
+    '''
+    Wraps a random generator and keeps the last batch of normal samples it returned.
+    '''
+    def __init__(self, rng):
+        self._rng = rng
+        self.samples = None
+
+    def normal(self, *args, **kwargs):
+        self.samples = self._rng.normal(*args, **kwargs)
+        return self.samples.copy()
+
+    def __getattr__(self, name):
+        return getattr(self._rng, name)
+
+
+class ReplaySimulator(FixedScheduleSimulator):
+    '''
+    Step by step simulator that uses, at each tick, the perturbation drawn for that tick by generate_trajectory.
+    '''
+    def __init__(self, s, samples):
+        super().__init__(s)
+        self._samples = samples
+        self._tick = 0
+
+    def _next_angle_noise(self, current_time: int) -> float:
+        self._tick = current_time // MILLISECONDS_PER_ITERATION - 1
+        return super()._next_angle_noise(current_time)
+
+    def _next_noise(self) -> float:
+        return float(self._samples[self._tick])
+
+
+def scalar_trajectory(simulator, initial_angle, initial_x, initial_y):
+    x, y, angle = initial_x, initial_y, initial_angle
+    positions = []
+    for i in range(N_STEPS):
+        x, y, angle = simulator.calculate_position((i + 1) * MILLISECONDS_PER_ITERATION, MILLISECONDS_PER_ITERATION, angle, x, y, speed=SPEED, **BOUNDS)
+        positions.append((x, y, angle))
+    return np.array(positions).T
+
+
+def test_generate_trajectory_matches_calculate_position():
+    # Without noise the trajectory only depends on the bounces, which must happen at the same steps
+    batched = FixedScheduleSimulator(s=0)
+    stepped = FixedScheduleSimulator(s=0)
+
+    xs, ys, angles = batched.generate_trajectory(N_STEPS, MILLISECONDS_PER_ITERATION, 0.3, 2, 2, speed=SPEED, **BOUNDS)
+    expected_xs, expected_ys, expected_angles = scalar_trajectory(stepped, 0.3, 2, 2)
+
+    assert xs.min() < BOUNDS['min_x'] and xs.max() > BOUNDS['max_x'] # The trajectory bounces on both walls
+    np.testing.assert_allclose(xs, expected_xs, atol=1e-9)
+    np.testing.assert_allclose(ys, expected_ys, atol=1e-9)
+    np.testing.assert_allclose(angles, expected_angles, atol=1e-9)
+    assert (batched._action, batched._next_action_time) == (stepped._action, stepped._next_action_time)
+
+
+def test_generate_trajectory_matches_calculate_position_with_noise():
+    # Same perturbations on both paths, both in the integrated blocks and in the steps near the walls
+    batched = FixedScheduleSimulator(s=1)
+    batched._rng = RecordingGenerator(batched._rng)
+
+    xs, ys, angles = batched.generate_trajectory(N_STEPS, MILLISECONDS_PER_ITERATION, 0.3, 2, 2, speed=SPEED, **BOUNDS)
+    stepped = ReplaySimulator(s=1, samples=batched._rng.samples)
+    expected_xs, expected_ys, expected_angles = scalar_trajectory(stepped, 0.3, 2, 2)
+
+    np.testing.assert_allclose(xs, expected_xs, atol=1e-9)
+    np.testing.assert_allclose(ys, expected_ys, atol=1e-9)
+    np.testing.assert_allclose(angles, expected_angles, atol=1e-9)
+
+
+def test_generate_actions_matches_calculate_position_schedule():
+    batched = FixedScheduleSimulator(s=1)
+    stepped = FixedScheduleSimulator(s=1)
+    times = MILLISECONDS_PER_ITERATION * np.arange(1, N_STEPS + 1)
+
+    actions = batched._generate_actions(times)
+    expected = []
+    for current_time in times:
+        stepped._next_angle_noise(int(current_time))
+        expected.append(stepped._action)
+
+    assert actions.tolist() == expected
+    assert (batched._action, batched._next_action_time) == (stepped._action, stepped._next_action_time)
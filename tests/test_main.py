@@ -0,0 +1,36 @@
+import json
+import os
+from classes.simulators.trajectory.factory import TrajectoryFactory
+from main import App, count_iterations
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+
+
+def test_count_iterations_matches_previous_loop():
+    # The previous loop advanced until current_time >= max_time_milliseconds
+    assert count_iterations(60000, 200) == 300
+    assert count_iterations(60000, 280) == 215
+    assert count_iterations(100, 300) == 1
+
+
+def test_float_durations_generate_trajectory(tmp_path):
+    # 60.0 is a valid integer for the schema and frequencies are not validated, both used to work
+    with open(os.path.join(ROOT, 'config.json')) as file:
+        config = json.load(file)
+    config['simulation_duration_seconds'] = 60.0
+    with open(os.path.join(ROOT, 'stations.json')) as file:
+        stations = json.load(file)
+    for station in stations:
+        station['frequency'] = float(station['frequency'])
+    (tmp_path / 'config.json').write_text(json.dumps(config))
+    (tmp_path / 'stations.json').write_text(json.dumps(stations))
+
+    app = App(str(tmp_path / 'config.json'), str(tmp_path / 'stations.json'), str(tmp_path))
+    milliseconds_per_iteration = min(station.frequency for station in app.stations)
+    n_steps = count_iterations(app.config.simulation_duration_seconds * 1000, milliseconds_per_iteration)
+
+    assert isinstance(n_steps, int) and n_steps == 300
+    simulator = TrajectoryFactory.create_trajectory_simulator(app.config.simulators['trajectory'])
+    xs, ys, angles = simulator.generate_trajectory(n_steps, milliseconds_per_iteration, app.config.initial_angle, app.config.initial_position['x'], app.config.initial_position['y'],
+                                                   app.config.min_x, app.config.max_x, app.config.min_y, app.config.max_y, app.config.speed_meters_second['min'])
+    assert len(xs) == len(ys) == len(angles) == n_steps